@@ -75,6 +75,33 @@ if (isSmallScreen) {
 let currentCounty = "all";
 let isZoomedToCounty = false;
 
+// Known county/town names used to recover a county from a free-text location
+const COUNTY_NAMES = [
+    "nairobi", "mombasa", "kisumu", "nakuru", "eldoret", "thika", "malindi", "kitale", "garissa", "kakamega",
+    "kisii", "meru", "nyeri", "machakos", "kitui", "embu", "isiolo", "lamu", "kilifi", "kwale", "tana river",
+    "taita taveta", "makueni", "kajiado", "narok", "nyamira", "bomet", "bungoma", "busia", "vihiga", "siaya",
+    "homa bay", "migori", "trans nzoia", "west pokot", "samburu", "turkana", "marsabit",
+    "mandera", "wajir", "laikipia", "nyandarua", "murang'a", "kiambu", "kirinyaga"
+];
+
+// Single alternation (longest names first) so each location is scanned once
+const COUNTY_NAME_RE = new RegExp(
+    "\\b(" +
+    [...COUNTY_NAMES]
+        .sort((a, b) => b.length - a.length)
+        .map(name => name.replace(/[.*+?^${}()|[\]\\]/g, "\\$&"))
+        .join("|") +
+    ")(?:\\s+county)?\\b"
+);
+
+// Display name for each matched county, e.g. "homa bay" -> "Homa bay"
+const COUNTY_DISPLAY_NAMES = Object.fromEntries(
+    COUNTY_NAMES.map(name => [name, name.charAt(0).toUpperCase() + name.slice(1)])
+);
+
+// Four-digit year (20xx) embedded in a free-text incident date
+const YEAR_RE = /\b(20\d{2})\b/;
+
 /**
  * Generate random points within a county polygon
  */
@@ -111,16 +138,15 @@ function filterDataByYearAndCounty(data, year, county) {
     
     // Filter by year
     if (year !== "all") {
-        filteredData = filteredData.filter(d => {
-            const victimYear = d.Year || extractYear(d["Date of Incident"]);
-            return victimYear === parseInt(year);
-        });
+        const targetYear = parseInt(year);
+        filteredData = filteredData.filter(d => d.Year === targetYear);
     }
     
     // Filter by county
     if (county !== "all") {
+        const targetCounty = county.toLowerCase();
         filteredData = filteredData.filter(d => {
-            return d.County && d.County.toLowerCase() === county.toLowerCase();
+            return d.County && d.County.toLowerCase() === targetCounty;
         });
     }
     
@@ -134,10 +160,25 @@ function extractYear(dateString) {
     if (!dateString || dateString === "Unknown") return null;
     
     // Try to extract year from various date formats
-    const yearMatch = dateString.match(/\b(20\d{2})\b/);
+    const yearMatch = YEAR_RE.exec(dateString);
     return yearMatch ? parseInt(yearMatch[1]) : null;
 }
 
+// Cache of location -> recovered county (locations repeat across records)
+const countyByLocation = new Map();
+
+/**
+ * Recover a county name from a free-text location
+ */
+function countyFromLocation(location) {
+    if (countyByLocation.has(location)) return countyByLocation.get(location);
+    
+    const match = COUNTY_NAME_RE.exec(location.toLowerCase());
+    const county = match ? COUNTY_DISPLAY_NAMES[match[1]] : null;
+    countyByLocation.set(location, county);
+    return county;
+}
+
 /**
  * Toggle filter panel collapse/expand
  */
@@ -909,30 +950,24 @@ const loadData = async function () {
         allMissingPersonsData.forEach(person => {
             if (person.County === "Unknown" && person.Location) {
                 // Try to match location to known counties
-                const location = person.Location.toLowerCase();
-                const countyNames = [
-                    "nairobi", "mombasa", "kisumu", "nakuru", "eldoret", "thika", "malindi", "kitale", "garissa", "kakamega",
-                    "kisii", "meru", "nyeri", "machakos", "kitui", "embu", "isiolo", "lamu", "kilifi", "kwale", "tana river",
-                    "taita taveta", "makueni", "kajiado", "narok", "nyamira", "bomet", "bungoma", "busia", "vihiga", "siaya",
-                    "homa bay", "migori", "kisumu", "nyamira", "trans nzoia", "west pokot", "samburu", "turkana", "marsabit",
-                    "mandera", "wajir", "isiolo", "laikipia", "nyandarua", "nyeri", "murang'a", "kiambu", "kirinyaga", "nyeri"
-                ];
-                
-                for (const county of countyNames) {
-                    if (location.includes(county)) {
-                        person.County = county.charAt(0).toUpperCase() + county.slice(1);
-                        break;
-                    }
+                const county = countyFromLocation(person.Location);
+                if (county) {
+                    person.County = county;
                 }
             }
         });
 
+        // Resolve each record's year once so filtering reads a single field
+        allMissingPersonsData.forEach(person => {
+            person.Year = person.Year || extractYear(person["Date of Incident"]);
+        });
+
         console.log(`Loaded ${allMissingPersonsData.length} victim records`);
         
         // Debug: Show year distribution
         const yearCounts = {};
         allMissingPersonsData.forEach(d => {
-            const year = d.Year || extractYear(d["Date of Incident"]);
+            const year = d.Year;
             if (year) {
                 yearCounts[year] = (yearCounts[year] || 0) + 1;
             }